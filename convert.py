@@ -1,17 +1,96 @@
 """
 MEOW Converter - Convert any image to AI-optimized Steganographic MEOW
 Usage: python convert.py input_image.jpg [output.meow]
+       python convert.py <directory|"glob"> [output_dir]
 """
 
 import sys
 import os
-from meow_format import MeowFormat
+import re
+import stat
+import glob
+import textwrap
+from functools import lru_cache
+
+
+USAGE = textwrap.dedent("""\
+    Usage: python convert.py <input_image> [output.meow]
+           python convert.py <directory|"glob"> [output_dir]
+
+    Examples:
+      python convert.py photo.jpg
+      python convert.py image.png enhanced_image.meow
+      python convert.py photos/
+      python convert.py "photos/*.jpg" converted/
+
+    Supported input formats:
+      • PNG, JPEG, GIF, BMP, TIFF
+      • Any format supported by PIL/Pillow
+
+    Enhanced MEOW features:
+      ✅ AI-optimized compression
+      ✅ Pre-computed feature maps
+      ✅ Cross-compatible fallback
+      ✅ 5x faster AI processing""")
+
+# ImageNet normalization used as the default preprocessing profile
+_IMAGENET_MEAN = (0.485, 0.456, 0.406)
+_IMAGENET_STD = (0.229, 0.224, 0.225)
+_DEFAULT_PREPROCESSING = {
+    'mean_rgb': _IMAGENET_MEAN,
+    'std_rgb': _IMAGENET_STD,
+    'input_size': (224, 224),  # Common model input
+    'normalization': 'imagenet',
+    'channels_first': False,
+    'dtype': 'float32'
+}
+
+# Input extensions picked up in batch mode
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff'})
+
+# Filename keyword patterns used by generate_smart_annotations.
+# Groups are listed in priority order; the first matching group wins.
+_CATEGORY_RE = re.compile(
+    r'(?P<cat>cat|kitten|feline)'
+    r'|(?P<dog>dog|puppy|canine)'
+    r'|(?P<person>person|human|face|portrait)'
+    r'|(?P<vehicle>car|vehicle|auto)'
+    r'|(?P<building>house|building|architecture)'
+)
+_CATEGORY_CLASSES = {
+    'cat': ['cat', 'animal'],
+    'dog': ['dog', 'animal'],
+    'person': ['person', 'face'],
+    'vehicle': ['vehicle', 'car'],
+    'building': ['building', 'architecture'],
+}
+_DOMAIN_RE = re.compile(r'(?P<medical>medical|xray|scan)|(?P<satellite>satellite|aerial|geo)')
+
+
+def _match_group(pattern, filename):
+    """Scan the filename once and return the highest-priority matching group"""
+    found = {match.lastgroup for match in pattern.finditer(filename)}
+    for group in pattern.groupindex:
+        if group in found:
+            return group
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_meow():
+    """Shared MeowFormat instance, reused across conversions in one process"""
+    # Deferred so usage/argument errors don't pay for PIL and NumPy imports
+    from meow_format import MeowFormat
+    return MeowFormat()
 
 
 def convert_image(input_path, output_path=None):
     """Convert image to Steganographic MEOW with AI optimizations"""
     
-    if not os.path.exists(input_path):
+    # Get input file info
+    try:
+        input_size = os.stat(input_path).st_size
+    except FileNotFoundError:
         print(f"❌ Error: Input file '{input_path}' not found")
         return False
     
@@ -19,21 +98,21 @@ def convert_image(input_path, output_path=None):
         base_name = os.path.splitext(input_path)[0]
         output_path = f"{base_name}.meow"
     
-    print(f"🔄 Converting '{input_path}' to Steganographic MEOW...")
-    print(f"📁 Input: {input_path}")
-    print(f"💾 Output: {output_path}")
-    
-    # Get input file info
-    input_size = os.path.getsize(input_path)
-    print(f"📊 Input size: {input_size:,} bytes")
-    
     # Create Steganographic MEOW with sample AI annotations
-    meow = MeowFormat()
+    meow = get_meow()
     
     # Generate sample AI annotations based on filename/content
     ai_annotations = generate_smart_annotations(input_path)
     
-    print(f"🤖 AI features: {len(ai_annotations.get('object_classes', []))} object classes")
+    # Report in one write so batch workers don't interleave line by line
+    out = [
+        f"🔄 Converting '{input_path}' to Steganographic MEOW...",
+        f"📁 Input: {input_path}",
+        f"💾 Output: {output_path}",
+        f"📊 Input size: {input_size:,} bytes",
+        f"🤖 AI features: {len(ai_annotations.get('object_classes', []))} object classes",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Convert using steganographic method
     success = meow.create_steganographic_meow(
@@ -43,18 +122,21 @@ def convert_image(input_path, output_path=None):
     )
     
     if success:
-        output_size = os.path.getsize(output_path)
+        output_size = meow.last_output_size
         ratio = output_size / input_size
         
-        print(f"✅ Conversion successful!")
-        print(f"📊 Output size: {output_size:,} bytes ({ratio:.2f}x)")
-        print(f"🎯 AI features included:")
-        print(f"   • Pre-computed feature maps")
-        print(f"   • Attention and saliency maps")
-        print(f"   • Multi-resolution pyramid")
-        print(f"   • Embedded preprocessing parameters")
-        print(f"   • Cross-compatible fallback image")
-        print(f"🚀 Performance: ~5x faster AI processing!")
+        out = [
+            "✅ Conversion successful!",
+            f"📊 Output size: {output_size:,} bytes ({ratio:.2f}x)",
+            "🎯 AI features included:",
+            "   • Pre-computed feature maps",
+            "   • Attention and saliency maps",
+            "   • Multi-resolution pyramid",
+            "   • Embedded preprocessing parameters",
+            "   • Cross-compatible fallback image",
+            "🚀 Performance: ~5x faster AI processing!",
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
         
         return True
     else:
@@ -62,47 +144,98 @@ def convert_image(input_path, output_path=None):
         return False
 
 
+def is_batch_target(target):
+    """Check whether a CLI target names a directory or a glob pattern
+    
+    An existing file is converted as-is even if its name contains glob
+    characters, e.g. 'photo[1].png'.
+    """
+    if os.path.isfile(target):
+        return False
+    return os.path.isdir(target) or any(c in target for c in '*?[')
+
+
+def find_images(target):
+    """Expand a directory or glob pattern into sorted (path, size) pairs"""
+    images = []
+    
+    if os.path.isdir(target):
+        # DirEntry caches its stat result, so is_file() and st_size share one call
+        with os.scandir(target) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                    images.append((entry.path, entry.stat().st_size))
+    else:
+        for path in glob.glob(target):
+            if os.path.splitext(path)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # Dangling symlink, or removed since the glob
+            if stat.S_ISREG(st.st_mode):
+                images.append((path, st.st_size))
+    
+    return sorted(images)
+
+
+def convert_batch(images, output_dir=None, workers=None):
+    """Convert (path, size) pairs in a process pool, returning the number converted"""
+    meow = get_meow()
+    paths = [input_path for input_path, _ in images]
+    
+    # MeowFormat.convert_many runs the pool; annotations are generated
+    # in the workers from the same filename rules as single-file mode
+    results = meow.convert_many(paths, output_dir, workers,
+                                annotate=generate_smart_annotations)
+    
+    # Sizes come from the find_images scan and the bytes each worker wrote
+    for (input_path, input_size), (success, output_size) in zip(images, results):
+        if not success:
+            print(f"❌ {input_path}: not converted")
+            continue
+        output_path = meow.output_path_for(input_path, output_dir)
+        print(f"✅ {input_path} → {output_path} "
+              f"({output_size:,} bytes, {output_size / input_size:.2f}x)")
+    
+    return sum(1 for success, _ in results if success)
+
+
+@lru_cache(maxsize=1024)
+def _classify_filename(filename):
+    """Return the (category, domain) keyword groups matched by a lowercased basename"""
+    return _match_group(_CATEGORY_RE, filename), _match_group(_DOMAIN_RE, filename)
+
+
 def generate_smart_annotations(input_path):
     """Generate intelligent AI annotations based on image analysis"""
     
-    filename = os.path.basename(input_path).lower()
+    # Only the filename scan is memoized; the returned dicts are built fresh
+    # on every call so callers can't mutate each other's annotations
+    category, domain = _classify_filename(os.path.basename(input_path).lower())
     
     # Smart object class detection based on filename patterns
     object_classes = ['background']
     
-    if any(word in filename for word in ['cat', 'kitten', 'feline']):
-        object_classes.extend(['cat', 'animal'])
-    elif any(word in filename for word in ['dog', 'puppy', 'canine']):
-        object_classes.extend(['dog', 'animal'])
-    elif any(word in filename for word in ['person', 'human', 'face', 'portrait']):
-        object_classes.extend(['person', 'face'])
-    elif any(word in filename for word in ['car', 'vehicle', 'auto']):
-        object_classes.extend(['vehicle', 'car'])
-    elif any(word in filename for word in ['house', 'building', 'architecture']):
-        object_classes.extend(['building', 'architecture'])
+    if category:
+        object_classes.extend(_CATEGORY_CLASSES[category])
     else:
         object_classes.extend(['object', 'foreground'])
     
     # Generate preprocessing parameters optimized for common models
-    preprocessing_params = {
-        'mean_rgb': [0.485, 0.456, 0.406],  # ImageNet standard
-        'std_rgb': [0.229, 0.224, 0.225],   # ImageNet standard
-        'input_size': [224, 224],           # Common model input
-        'normalization': 'imagenet',
-        'channels_first': False,
-        'dtype': 'float32'
-    }
+    # (shallow copy: domain overrides below replace whole values)
+    preprocessing_params = dict(_DEFAULT_PREPROCESSING)
     
     # If it looks like a specific domain, adjust parameters
-    if any(word in filename for word in ['medical', 'xray', 'scan']):
+    if domain == 'medical':
         preprocessing_params.update({
-            'mean_rgb': [0.5, 0.5, 0.5],
-            'std_rgb': [0.5, 0.5, 0.5],
+            'mean_rgb': (0.5, 0.5, 0.5),
+            'std_rgb': (0.5, 0.5, 0.5),
             'normalization': 'medical'
         })
-    elif any(word in filename for word in ['satellite', 'aerial', 'geo']):
+    elif domain == 'satellite':
         preprocessing_params.update({
-            'input_size': [512, 512],
+            'input_size': (512, 512),
             'normalization': 'satellite'
         })
     
@@ -128,26 +261,28 @@ def main():
     print("=" * 40)
     
     if len(sys.argv) < 2:
-        print("Usage: python convert.py <input_image> [output.meow]")
-        print()
-        print("Examples:")
-        print("  python convert.py photo.jpg")
-        print("  python convert.py image.png enhanced_image.meow")
-        print()
-        print("Supported input formats:")
-        print("  • PNG, JPEG, GIF, BMP, TIFF")
-        print("  • Any format supported by PIL/Pillow")
-        print()
-        print("Enhanced MEOW features:")
-        print("  ✅ AI-optimized compression")
-        print("  ✅ Pre-computed feature maps")
-        print("  ✅ Cross-compatible fallback")
-        print("  ✅ 5x faster AI processing")
+        print(USAGE)
         return
     
     input_path = sys.argv[1]
     output_path = sys.argv[2] if len(sys.argv) > 2 else None
     
+    # Batch mode: convert every image in a directory or glob in one process pool
+    if is_batch_target(input_path):
+        images = find_images(input_path)
+        if not images:
+            print(f"❌ Error: No images found for '{input_path}'")
+            sys.exit(1)
+        
+        print(f"📂 Batch converting {len(images)} images...")
+        converted = convert_batch(images, output_path)
+        
+        print()
+        print(f"🎉 Converted {converted}/{len(images)} images")
+        if converted < len(images):
+            sys.exit(1)
+        return
+    
     # Convert
     success = convert_image(input_path, output_path)
     
@@ -7,12 +7,18 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import tkinter.font as tkFont
 from PIL import Image, ImageTk
+import numpy as np
 import os
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from meow_format import MeowFormat, smart_fallback_loader
 
 
 class MeowGUI:
+    DISPLAY_CACHE_SIZE = 4  # Recent fit-to-canvas resizes kept for re-display
+    RESIZE_SETTLE_MS = 120  # Quiet time after a resize before the LANCZOS redraw
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Steganographic MEOW Viewer")
@@ -22,8 +28,26 @@ class MeowGUI:
         self.current_image = None
         self.current_meow = None
         self.ai_metadata = None
+        self.draft_source = None  # (path, full size) when current_image was decoded reduced
+        self.photo = None
+        self.photo_key = None  # (mode, size) of the pixels held by self.photo
+        self.photo_source = None  # PIL image last copied into self.photo
+        self.display_cache = OrderedDict()  # (id(image), size) -> (resized, image) for current_image
+        self.canvas_size = None  # Last (width, height) seen by on_canvas_resize
+        self.fast_redraw = None  # after_idle() id of the pending BILINEAR redraw
+        self.final_redraw = None  # after() id of the pending full-quality redraw
+        self.payload_sizes = None  # (meow_data, sizes) from _payload_sizes
         self.viewer_capabilities = {'supports_meow': True, 'universal_compatibility': True}
         
+        # Opens and conversions run on worker threads; see _when_done
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.pending_open = None  # Future of the most recent open_meow
+        self.converting = False
+        
+        # Register all PIL codecs now so the first open/convert doesn't pay
+        # for the plugin imports inside a Tk callback
+        Image.init()
+        
         # Setup GUI
         self.setup_menu()
         self.setup_main_interface()
@@ -77,6 +101,10 @@ class MeowGUI:
         
         self.image_canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
         
+        # Single image item, updated in place by display_image
+        self.canvas_image_id = self.image_canvas.create_image(0, 0, anchor=tk.NW)
+        self.image_canvas.bind('<Configure>', self.on_canvas_resize)
+        
         self.image_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -92,7 +120,8 @@ class MeowGUI:
         
         ttk.Button(button_frame, text="Open Other Image", command=self.open_image).pack(side=tk.LEFT, padx=2)
         ttk.Button(button_frame, text="Open MEOW", command=self.open_meow).pack(side=tk.LEFT, padx=2)
-        ttk.Button(button_frame, text="Convert to MEOW", command=self.convert_to_meow).pack(side=tk.LEFT, padx=2)
+        self.convert_button = ttk.Button(button_frame, text="Convert to MEOW", command=self.convert_to_meow)
+        self.convert_button.pack(side=tk.LEFT, padx=2)
         
         # Separator
         separator = ttk.Separator(main_frame, orient=tk.VERTICAL)
@@ -244,7 +273,21 @@ class MeowGUI:
         
         if file_path:
             try:
-                self.current_image = Image.open(file_path)
+                self.pending_open = None  # Drop any MEOW still loading
+                image = Image.open(file_path)
+                
+                # Let libjpeg decode at a reduced scale that still covers the
+                # largest canvas the window can grow to, so later resizes never
+                # need a second decode; conversion reopens the file at full
+                # resolution
+                full_size = image.size
+                if image.format == 'JPEG':
+                    image.draft(image.mode, self._display_bounds())
+                self.draft_source = (file_path, full_size) if image.size != full_size else None
+                
+                # Cached resizes hold their source, so drop the old image's
+                self.display_cache.clear()
+                self.current_image = image
                 self.display_image(self.current_image)
                 self.current_meow = None
                 self.ai_metadata = None
@@ -263,45 +306,75 @@ class MeowGUI:
             ]        )
         
         if file_path:
-            try:
-                # Use smart fallback loader
-                self.current_image = smart_fallback_loader(file_path)
-                  # Try to load MEOW data if it's a MEOW file
-                if file_path.lower().endswith('.meow'):
-                    self.current_meow = MeowFormat()
-                    img, meow_data = self.current_meow.load_steganographic_meow(file_path)
-                    if meow_data:
-                        # Store the extracted MEOW data for display
-                        self.extracted_meow_data = meow_data
-                        
-                        # Populate AI metadata from extracted data
-                        from meow_format import AIMetadata
-                        self.ai_metadata = AIMetadata()
-                        
-                        # Extract AI annotations if present
-                        if 'ai_annotations' in meow_data:
-                            annotations = meow_data['ai_annotations']
-                            if 'object_classes' in annotations:
-                                self.ai_metadata.object_classes = annotations['object_classes']
-                            if 'bounding_boxes' in annotations:
-                                self.ai_metadata.bounding_boxes = annotations['bounding_boxes']
-                            if 'preprocessing_params' in annotations:
-                                self.ai_metadata.preprocessing_params = annotations['preprocessing_params']
-                        
-                        # Extract features if present
-                        if 'features' in meow_data:
-                            features = meow_data['features']
-                            self.ai_metadata.edge_density = features.get('edge_density')
-                            self.ai_metadata.complexity_map = {'brightness': features.get('brightness')}
-                    else:
-                        self.extracted_meow_data = None
+            # Decode off the Tk thread; the result is applied in _open_meow_done
+            self.update_status("Loading...")
+            future = self.executor.submit(self._open_meow_worker, file_path)
+            self.pending_open = future
+            self._when_done(future, self._open_meow_done, file_path)
+    
+    def _open_meow_worker(self, file_path):
+        """Load an image and its MEOW data in a worker thread (no Tk calls)"""
+        # A MEOW file is loaded once for both its pixels and its
+        # hidden data; anything else goes through the fallback loader
+        meow, meow_data = None, None
+        if file_path[-5:].lower() == '.meow':
+            meow = MeowFormat()
+            image, meow_data = meow.load_steganographic_meow(file_path)
+        else:
+            image = smart_fallback_loader(file_path)
+        
+        # Decode the pixels here rather than on first display
+        if image is not None:
+            image.load()
+        return image, meow, meow_data
+    
+    def _open_meow_done(self, future, file_path):
+        """Show a loaded MEOW file; runs on the Tk thread"""
+        if future is not self.pending_open:
+            return  # A newer open superseded this one
+        self.pending_open = None
+        
+        try:
+            image, meow, meow_data = future.result()
+        except Exception as e:
+            self.update_status()
+            messagebox.showerror("Error", f"Failed to open MEOW file: {e}")
+            return
+        
+        self.display_cache.clear()
+        self.current_image = image
+        self.draft_source = None
+        if meow is not None:
+            self.current_meow = meow
+            if meow_data:
+                # Store the extracted MEOW data for display
+                self.extracted_meow_data = meow_data
                 
-                self.display_image(self.current_image)
-                self.update_ai_display()
-                self.update_status(f"Loaded MEOW: {os.path.basename(file_path)}")
+                # Populate AI metadata from extracted data
+                from meow_format import AIMetadata
+                self.ai_metadata = AIMetadata()
                 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open MEOW file: {e}")
+                # Extract AI annotations if present
+                if 'ai_annotations' in meow_data:
+                    annotations = meow_data['ai_annotations']
+                    if 'object_classes' in annotations:
+                        self.ai_metadata.object_classes = annotations['object_classes']
+                    if 'bounding_boxes' in annotations:
+                        self.ai_metadata.bounding_boxes = annotations['bounding_boxes']
+                    if 'preprocessing_params' in annotations:
+                        self.ai_metadata.preprocessing_params = annotations['preprocessing_params']
+                
+                # Extract features if present
+                if 'features' in meow_data:
+                    features = meow_data['features']
+                    self.ai_metadata.edge_density = features.get('edge_density')
+                    self.ai_metadata.complexity_map = {'brightness': features.get('brightness')}
+            else:
+                self.extracted_meow_data = None
+        
+        self.display_image(self.current_image)
+        self.update_ai_display()
+        self.update_status(f"Loaded MEOW: {os.path.basename(file_path)}")
     
     def convert_to_meow(self):
         """Convert current image to Enhanced MEOW"""
@@ -309,6 +382,10 @@ class MeowGUI:
             messagebox.showwarning("Warning", "No image loaded")
             return
         
+        if self.converting:
+            messagebox.showinfo("Info", "A conversion is already running")
+            return
+        
         output_path = filedialog.asksaveasfilename(
             title="Save Enhanced MEOW File",
             defaultextension=".meow",
@@ -316,42 +393,89 @@ class MeowGUI:
         )
         
         if output_path:
-            try:                # Create enhanced MEOW with sample AI annotations
-                meow = MeowFormat()
-                
-                # Generate sample annotations based on image
-                ai_annotations = self.generate_sample_annotations()
-                
-                # Save temporary PNG for conversion
-                temp_png = "temp_convert.png"
-                self.current_image.save(temp_png, "PNG")
-                
-                success = meow.create_steganographic_meow(temp_png, output_path, 
-                                                        ai_annotations=ai_annotations)
-                
-                # Clean up temp file
-                if os.path.exists(temp_png):
-                    os.remove(temp_png)
-                
-                if success:
-                    messagebox.showinfo("Success", f"Steganographic MEOW saved: {output_path}")
-                    
-                    # Reload to show AI features
-                    self.current_meow = meow
-                    self.ai_metadata = meow.get_ai_metadata()
-                    self.update_ai_display()
-                else:
-                    messagebox.showerror("Error", "Failed to create Steganographic MEOW file")
-                    
-            except Exception as e:
-                messagebox.showerror("Error", f"Conversion failed: {e}")
+            # Generate sample annotations based on image
+            ai_annotations = self.generate_sample_annotations()
+            
+            # The worker only reads the pixels, so once they are loaded the
+            # viewer can keep drawing the same image without a copy. A
+            # reduced JPEG decode is replaced by the full file in the worker.
+            image = self.current_image
+            image.load()
+            source_path = self.draft_source[0] if self.draft_source else None
+            
+            # Run the conversion off the Tk thread so the window stays responsive
+            self.converting = True
+            self.convert_button.state(['disabled'])
+            self.update_status("Converting to Steganographic MEOW...")
+            future = self.executor.submit(self._convert_worker, image, output_path,
+                                          ai_annotations, source_path)
+            self._when_done(future, self._convert_done, output_path, image)
+    
+    def _convert_worker(self, image, output_path, ai_annotations, source_path=None):
+        """Create the MEOW file in a worker thread (no Tk calls)
+        
+        source_path, when given, is reopened so the conversion uses the
+        full-resolution pixels rather than the reduced display decode.
+        """
+        # Create enhanced MEOW with sample AI annotations
+        meow = MeowFormat()
+        
+        if source_path:
+            image = Image.open(source_path)
+        
+        # Hand the pixels over directly instead of a temporary PNG round-trip
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        success = meow.create_steganographic_meow_from_array(np.asarray(image), output_path,
+                                                             ai_annotations=ai_annotations)
+        
+        return meow, success
+    
+    def _convert_done(self, future, output_path, source_image):
+        """Report a finished conversion; runs on the Tk thread
+        
+        source_image is the image that was converted. The viewer state is
+        only updated if it is still the one on screen.
+        """
+        self.converting = False
+        self.convert_button.state(['!disabled'])
+        self.update_status()
+        
+        try:
+            meow, success = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Conversion failed: {e}")
+            return
+        
+        if success:
+            messagebox.showinfo("Success", f"Steganographic MEOW saved: {output_path}")
+            
+            # Reload to show AI features, unless another file was opened
+            # while the conversion ran
+            if self.current_image is source_image:
+                self.current_meow = meow
+                self.ai_metadata = meow.get_ai_metadata()
+                self.update_ai_display()
+                self.update_status()
+        else:
+            messagebox.showerror("Error", "Failed to create Steganographic MEOW file")
+    
+    def _when_done(self, future, callback, *args):
+        """Call callback(future, *args) on the Tk thread once future finishes
+        
+        Polling from the Tk side keeps every widget call on the main thread.
+        """
+        if future.done():
+            callback(future, *args)
+        else:
+            self.root.after(50, self._when_done, future, callback, *args)
     
     def generate_sample_annotations(self):
         """Generate sample AI annotations for demonstration"""
         if not self.current_image:
             return {}
         
-        width, height = self.current_image.size
+        width, height = self._full_size()
         
         return {
             'object_classes': ['background', 'foreground'],
@@ -370,8 +494,12 @@ class MeowGUI:
             }
         }
     
-    def display_image(self, image):
-        """Display image on canvas"""
+    def display_image(self, image, quality='final'):
+        """Display image on canvas
+        
+        quality='fast' resamples with BILINEAR for interactive redraws;
+        'final' uses LANCZOS.
+        """
         if image:
             # Resize image if too large
             canvas_width = self.image_canvas.winfo_width()
@@ -387,21 +515,95 @@ class MeowGUI:
                 
                 if scale < 1.0:
                     new_size = (int(img_width * scale), int(img_height * scale))
-                    display_image = image.resize(new_size, Image.Resampling.LANCZOS)
+                    if quality == 'fast':
+                        display_image = image.resize(new_size, Image.Resampling.BILINEAR,
+                                                     reducing_gap=3.0)
+                    else:
+                        display_image = self._resized_for_display(image, new_size)
                 else:
                     display_image = image
             else:
                 display_image = image
             
-            # Convert to PhotoImage
-            self.photo = ImageTk.PhotoImage(display_image)
+            # Convert to PhotoImage. The same frame (e.g. a cached resize) is
+            # already on screen; otherwise paste into the current photo when
+            # the size and mode match instead of allocating a new Tk photo.
+            photo_key = (display_image.mode, display_image.size)
+            if self.photo is not None and display_image is self.photo_source:
+                pass
+            elif self.photo is not None and self.photo_key == photo_key:
+                self.photo.paste(display_image)
+            else:
+                self.photo = ImageTk.PhotoImage(display_image)
+                self.photo_key = photo_key
+            self.photo_source = display_image
+            
+            # Point the existing canvas item at the new image
+            self.image_canvas.itemconfig(self.canvas_image_id, image=self.photo)
             
-            # Clear canvas and display image
-            self.image_canvas.delete("all")
-            self.image_canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
-              # Update scroll region
+            # Update scroll region
             self.image_canvas.configure(scrollregion=self.image_canvas.bbox("all"))
     
+    def on_canvas_resize(self, event):
+        """Refit the image while the canvas is being resized"""
+        # <Configure> also fires for moves and restacking; only size matters
+        size = (event.width, event.height)
+        if size == self.canvas_size:
+            return
+        self.canvas_size = size
+        
+        if not self.current_image:
+            return
+        
+        # A burst of events gets one cheap frame per idle pass, and one
+        # full-quality redraw once resizing pauses
+        if self.fast_redraw is None:
+            self.fast_redraw = self.root.after_idle(self._fast_redraw)
+        if self.final_redraw is not None:
+            self.root.after_cancel(self.final_redraw)
+        self.final_redraw = self.root.after(self.RESIZE_SETTLE_MS, self._final_redraw)
+    
+    def _fast_redraw(self):
+        """Redraw the current image with BILINEAR during a resize"""
+        self.fast_redraw = None
+        if self.current_image:
+            self.display_image(self.current_image, quality='fast')
+    
+    def _final_redraw(self):
+        """Redraw the current image with LANCZOS after a resize"""
+        self.final_redraw = None
+        if self.current_image:
+            self.display_image(self.current_image)
+    
+    def _display_bounds(self):
+        """Upper bound on the canvas size: the canvas can't outgrow the screen"""
+        return self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+    
+    def _full_size(self):
+        """Size of the current image at full resolution"""
+        if self.draft_source:
+            return self.draft_source[1]
+        return self.current_image.size
+    
+    def _resized_for_display(self, image, size):
+        """Return image resized to size, reusing recent results"""
+        key = (id(image), size)
+        entry = self.display_cache.get(key)
+        if entry is not None:
+            self.display_cache.move_to_end(key)
+            return entry[0]
+        
+        # reducing_gap lets Pillow box-reduce by an integer factor
+        # before the LANCZOS pass on large downscales
+        resized = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        
+        # The source is kept alive alongside its result so its id() can't
+        # be reused by another image while the entry exists
+        self.display_cache[key] = (resized, image)
+        if len(self.display_cache) > self.DISPLAY_CACHE_SIZE:
+            self.display_cache.popitem(last=False)
+        return resized
+    
     def update_ai_display(self):
         """Update AI features display"""
         # Clear all displays
@@ -474,21 +676,45 @@ class MeowGUI:
         stego_info = "Steganographic Storage\n" + "="*25 + "\n\n"
         
         # Calculate hidden data size
-        hidden_data_size = len(json.dumps(meow_data).encode())
+        hidden_data_size, section_sizes = self._payload_sizes(meow_data)
         stego_info += f"Hidden Data Size: {hidden_data_size:,} bytes\n"
         stego_info += f"Storage Method: LSB Steganography\n"
         stego_info += f"Channels Used: RGB (2 bits each)\n"
         stego_info += f"Capacity Used: {hidden_data_size} bytes\n"
-          # Add data breakdown
+        
+        # Add data breakdown
         self.chunks_tree.insert('', tk.END, text="Features",
-                               values=(f"{len(str(meow_data.get('features', {})))} chars", "AI feature data"))
+                               values=(f"{section_sizes['features']} chars", "AI feature data"))
         self.chunks_tree.insert('', tk.END, text="Attention",
-                               values=(f"{len(str(meow_data.get('attention_maps', {})))} chars", "Attention maps"))
+                               values=(f"{section_sizes['attention_maps']} chars", "Attention maps"))
         self.chunks_tree.insert('', tk.END, text="Annotations",
-                               values=(f"{len(str(meow_data.get('ai_annotations', {})))} chars", "AI annotations"))
+                               values=(f"{section_sizes['ai_annotations']} chars", "AI annotations"))
         
         self.size_text.insert(tk.END, stego_info)
     
+    def _payload_sizes(self, meow_data):
+        """Return (total bytes, per-section chars) of meow_data as compact JSON
+        
+        The total comes from the MeowFormat that loaded the data when it is
+        known. The result is kept for the last payload shown, so refreshing
+        the panel for the same data doesn't serialize it again.
+        """
+        if self.payload_sizes is not None and self.payload_sizes[0] is meow_data:
+            return self.payload_sizes[1]
+        
+        separators = (',', ':')
+        section_sizes = {
+            key: len(json.dumps(meow_data.get(key, {}), separators=separators))
+            for key in ('features', 'attention_maps', 'ai_annotations')
+        }
+        if self.current_meow is not None and self.current_meow.last_payload_size:
+            total = self.current_meow.last_payload_size
+        else:
+            total = len(json.dumps(meow_data, separators=separators).encode())
+        
+        self.payload_sizes = (meow_data, (total, section_sizes))
+        return total, section_sizes
+    
     def on_object_select(self, event):
         """Handle object selection in treeview"""
         selection = self.objects_tree.selection()
@@ -578,7 +804,7 @@ class MeowGUI:
     def update_status(self, message="Ready"):
         """Update status bar"""
         if self.current_image:
-            width, height = self.current_image.size
+            width, height = self._full_size()
             mode = self.current_image.mode
             ai_status = " | AI Enhanced" if self.current_meow else " | Standard Format"
             self.status_var.set(f"{message} | {width}x{height} {mode}{ai_status}")
@@ -40,11 +40,11 @@ class SteganographicMeowFormat:
                 img = img.convert('RGBA')
             
             if output_path is None:
-                output_path = image_path.rsplit('.', 1)[0] + '.meow'
+                output_path = os.path.splitext(image_path)[0] + '.meow'
             
             # Ensure .meow extension
-            if not output_path.lower().endswith('.meow'):
-                output_path = output_path.rsplit('.', 1)[0] + '.meow'
+            if output_path[-5:].lower() != '.meow':
+                output_path = os.path.splitext(output_path)[0] + '.meow'
             
             # Prepare MEOW data for hiding
             meow_data = self._prepare_meow_data(img, ai_annotations)
@@ -69,9 +69,10 @@ class SteganographicMeowFormat:
     def _prepare_meow_data(self, img: Image.Image, ai_annotations: Dict = None) -> bytes:
         """Prepare all MEOW data for hiding"""
         
-        # Generate AI features
-        features = self._generate_features(img)
-        attention = self._generate_attention_maps(img)
+        # Generate AI features from a single grayscale conversion
+        gray = np.asarray(img.convert('L'))
+        features = self._generate_features(gray)
+        attention = self._generate_attention_maps(gray)
         
         # Combine all data
         meow_data = {
@@ -142,10 +143,8 @@ class SteganographicMeowFormat:
         result_array = flat_img.reshape(height, width, channels)
         return Image.fromarray(result_array, 'RGBA')
     
-    def _generate_features(self, img: Image.Image) -> Dict:
+    def _generate_features(self, gray: np.ndarray) -> Dict:
         """Generate AI features"""
-        gray = np.array(img.convert('L'))
-        
         # Edge detection
         edges_x = np.abs(np.diff(gray.astype(np.float32), axis=1))
         edges_y = np.abs(np.diff(gray.astype(np.float32), axis=0))
@@ -157,10 +156,8 @@ class SteganographicMeowFormat:
             'complexity': float(np.var(gray))
         }
     
-    def _generate_attention_maps(self, img: Image.Image) -> Dict:
+    def _generate_attention_maps(self, gray: np.ndarray) -> Dict:
         """Generate attention data"""
-        gray = np.array(img.convert('L'))
-        
         # Simple gradient-based saliency
         grad_x = np.abs(np.diff(gray.astype(np.float32), axis=1))
         grad_y = np.abs(np.diff(gray.astype(np.float32), axis=0))
@@ -169,7 +166,7 @@ class SteganographicMeowFormat:
         grad_x = np.pad(grad_x, ((0, 0), (0, 1)), mode='edge')
         grad_y = np.pad(grad_y, ((0, 1), (0, 0)), mode='edge')
         
-        saliency = np.sqrt(grad_x**2 + grad_y**2)
+        saliency = np.hypot(grad_x, grad_y)
         
         return {
             'max_saliency': float(np.max(saliency)),
@@ -214,7 +211,7 @@ class SteganographicMeowFormat:
             if img.mode != 'RGBA':
                 img = img.convert('RGBA')
             
-            img_array = np.array(img)
+            img_array = np.asarray(img)
             height, width, channels = img_array.shape
             
             # Extract bits from LSBs
@@ -349,7 +346,7 @@ def main():
     
     if success:
         # Test loading
-        final_path = output_path or (input_path.rsplit('.', 1)[0] + '.meow')
+        final_path = output_path or (os.path.splitext(input_path)[0] + '.meow')
         
         print(f"\n🧪 Testing compatibility:")
         print(f"📁 File: {final_path}")